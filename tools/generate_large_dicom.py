@@ -8,15 +8,31 @@ your HTJ2K viewer implementation with AWS HealthImaging.
 Requirements:
     pip install pydicom pillow numpy
 
+    Optionally `pip install numba` to JIT-compile the CT/MR synthesizers
+    (falls back to plain numpy when it is not available). It is left
+    commented out in requirements.txt so it never becomes a hard install.
+
 Usage:
     python generate_large_dicom.py --size 100MB --output test_100mb.dcm
     python generate_large_dicom.py --size 500MB --modality MR --output test_mr_500mb.dcm
+    python generate_large_dicom.py --manifest corpus.json --jobs 4
+
+The manifest is a JSON list of files to generate in parallel, e.g.
+    [{"size": "100MB", "output": "ct_100mb.dcm", "modality": "CT",
+      "patient_name": "TestPatient^CT100MB", "seed": 42}]
 """
 
 import argparse
+import io
+import json
+import math
+import multiprocessing
 import os
+import struct
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+from functools import lru_cache
 import numpy as np
 from PIL import Image
 import pydicom
@@ -24,6 +40,15 @@ from pydicom.dataset import Dataset, FileMetaDataset
 from pydicom.uid import UID, generate_uid
 import pydicom.uid
 
+try:
+    from numba import config as numba_config, njit, prange, set_num_threads
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Modalities the image synthesizers support
+MODALITIES = ('CT', 'MR', 'US')
+
 def parse_size(size_str):
     """Parse size string like '100MB', '1GB' into bytes"""
     size_str = size_str.upper().strip()
@@ -38,6 +63,7 @@ def parse_size(size_str):
         # Assume bytes
         return int(size_str)
 
+@lru_cache(maxsize=128)
 def calculate_dimensions(target_size_bytes, bits_per_pixel=16):
     """Calculate image dimensions to achieve target file size"""
     
@@ -54,7 +80,7 @@ def calculate_dimensions(target_size_bytes, bits_per_pixel=16):
     
     if total_pixels < 512 * 512:
         # Small image
-        width = height = int(np.sqrt(total_pixels))
+        width = height = math.isqrt(total_pixels)
     elif total_pixels < 1024 * 1024:
         # Medium image - try 1024x512 or similar
         width = 1024
@@ -65,7 +91,7 @@ def calculate_dimensions(target_size_bytes, bits_per_pixel=16):
         height = total_pixels // width
     else:
         # Very large image - calculate square dimensions
-        side = int(np.sqrt(total_pixels))
+        side = math.isqrt(total_pixels)
         width = height = side
     
     # Ensure dimensions are reasonable
@@ -74,96 +100,312 @@ def calculate_dimensions(target_size_bytes, bits_per_pixel=16):
     
     return width, height
 
-def generate_realistic_medical_image(width, height, modality='CT'):
-    """Generate realistic-looking medical image data"""
+if HAS_NUMBA:
+    # Fused per-pixel kernels: each computes the squared distance, picks the
+    # tissue for the pixel and draws its sample in a single parallel sweep,
+    # so no mask or noise temporaries are ever materialized. numba keeps one
+    # generator per thread, so each row reseeds it from seed + row; the output
+    # is then reproducible no matter how rows are scheduled onto threads.
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _synth_ct(image, cx, cy, body_r2, spine_half_width, spine_top, spine_bottom,
+                  rib_x, rib_y, rib_r2, lung_offset, lung_r2, seed):
+        height, width = image.shape
+        for i in prange(height):
+            np.random.seed(seed + i)
+            dy = i - cy
+            dy2 = dy * dy
+            for j in range(width):
+                dx = j - cx
+                # Later structures paint over earlier ones: lungs > ribs > spine > body
+                if ((dx + lung_offset)**2 + dy2 < lung_r2
+                        or (dx - lung_offset)**2 + dy2 < lung_r2):
+                    v = np.random.normal(-1000.0, 100.0)
+                else:
+                    in_rib = False
+                    for k in range(rib_x.shape[0]):
+                        rx = j - rib_x[k]
+                        ry = i - rib_y[k]
+                        if rx * rx + ry * ry < rib_r2:
+                            in_rib = True
+                            break
+                    if in_rib:
+                        v = np.random.normal(2800.0, 200.0)
+                    elif abs(dx) < spine_half_width and spine_top < i < spine_bottom:
+                        v = np.random.normal(3000.0, 300.0)
+                    elif dx * dx + dy2 < body_r2:
+                        v = np.random.normal(1000.0, 200.0)
+                    else:
+                        v = 0.0
+                image[i, j] = np.uint16(min(max(v, 0.0), 65535.0))
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _synth_mr(image, cx, cy, brain_r2, white_matter_r2, seed):
+        height, width = image.shape
+        for i in prange(height):
+            np.random.seed(seed + i)
+            dy = i - cy
+            dy2 = dy * dy
+            for j in range(width):
+                dx = j - cx
+                r2 = dx * dx + dy2
+                if r2 < brain_r2:
+                    if np.random.random() < 0.05:
+                        v = np.random.normal(10000.0, 1000.0)
+                    elif r2 <= white_matter_r2:
+                        v = np.random.normal(45000.0, 2000.0)
+                    else:
+                        v = np.random.normal(30000.0, 3000.0)
+                else:
+                    v = 0.0
+                image[i, j] = np.uint16(min(max(v, 0.0), 65535.0))
+
+
+def _synthesize_jit(width, height, modality, rng):
+    """Generate a CT/MR image with the fused numba kernels"""
+    
+    image = np.empty((height, width), dtype=np.uint16)
+    # Base for the kernels' per-row seeds, drawn from the image generator
+    seed = int(rng.integers(0, 2**32 - height))
+    center_y, center_x = height // 2, width // 2
+    m = min(width, height)
+    
+    if modality == 'CT':
+        # Geometry constants
+        body_r2 = (m * 0.4)**2
+        spine_half_width = width * 0.05
+        spine_top, spine_bottom = center_y * 0.5, center_y * 1.5
+        angles = np.linspace(0, np.pi, 8)
+        rib_x = center_x + np.cos(angles) * width * 0.3
+        rib_y = center_y + np.sin(angles) * height * 0.2
+        rib_r2 = (width * 0.02)**2
+        lung_offset = width * 0.15
+        lung_r2 = (width * 0.12)**2
+        _synth_ct(
+            image, float(center_x), float(center_y), body_r2,
+            spine_half_width, spine_top, spine_bottom,
+            rib_x, rib_y, rib_r2, lung_offset, lung_r2, seed
+        )
+    else:
+        # Geometry constants
+        brain_r2 = (m * 0.35)**2
+        white_matter_r2 = (m * 0.15)**2
+        _synth_mr(image, float(center_x), float(center_y), brain_r2, white_matter_r2, seed)
+    
+    return image
+
+# Edge length of the square tiles the numpy fallback synthesizes at a time,
+# sized so a tile's masks and noise temporaries stay cache resident
+TILE_SIZE = 512
+
+# Cap on the threads one image's synthesis may use; None means one per core.
+# Batch workers lower it so jobs x threads does not oversubscribe the cores.
+_max_threads = None
+
+# 65536 precomputed Rayleigh(20000) samples; US speckle is drawn by indexing
+# this 128 KB table with random uint16s instead of sampling float64 per pixel
+_RAYLEIGH_LUT = np.minimum(np.random.default_rng(0).rayleigh(20000, 1 << 16), 65535).astype(np.uint16)
+
+def _gaussian_noise(rng, mean, std, shape):
+    """Draw uint16 Gaussian tissue noise via a float32 staging buffer
+    
+    standard_normal with dtype=float32 produces half the bytes of the default
+    float64 sampler, and the scale/shift is done in place on that buffer.
+    Values are clamped before the cast so negative or oversized samples
+    saturate instead of wrapping around.
+    """
+    
+    noise = rng.standard_normal(shape, dtype=np.float32)
+    noise *= std
+    noise += mean
+    np.clip(noise, 0, 65535, out=noise)
+    return noise.astype(np.uint16)
+
+# Per-tissue Gaussian parameters, indexed by the tile label maps (0 is air)
+_CT_MEAN = np.array([0, 1000, 3000, 2800, -1000], dtype=np.float32)  # air, body, spine, rib, lung
+_CT_STD = np.array([0, 200, 300, 200, 100], dtype=np.float32)
+_MR_MEAN = np.array([0, 30000, 45000, 10000], dtype=np.float32)  # air, gray, white, CSF
+_MR_STD = np.array([0, 3000, 2000, 1000], dtype=np.float32)
+
+def _fill_tissues(tile, rng, labels, means, stds):
+    """Write mean[label] + std[label] * z into tile from one float32 normal field
+    
+    A single draw covers every tissue, so no noise is generated for pixels a
+    mask would discard. Samples are clamped before the uint16 cast.
+    """
+    
+    noise = rng.standard_normal(labels.shape, dtype=np.float32)
+    noise *= stds[labels]
+    noise += means[labels]
+    np.clip(noise, 0, 65535, out=noise)
+    np.copyto(tile, noise, casting='unsafe')
+
+def _ct_tile(tile, rng, dx, dy, width, height):
+    """Fill one tile of a CT image; dx/dy are float32 offsets from the image center"""
+    
+    # CT scan - simulate body cross-section with bones, organs, air
+    
+    # Geometry constants
+    m = min(width, height)
+    body_r2 = np.float32((m * 0.4)**2)
+    spine_half_width = np.float32(width * 0.05)
+    spine_half_height = np.float32((height // 2) * 0.5)
+    angles = np.linspace(0, np.pi, 8)
+    rib_dx = (np.cos(angles) * width * 0.3).astype(np.float32)[:, np.newaxis, np.newaxis]
+    rib_dy = (np.sin(angles) * height * 0.2).astype(np.float32)[:, np.newaxis, np.newaxis]
+    rib_r2 = np.float32((width * 0.02)**2)
+    lung_offset = np.float32(width * 0.15)
+    lung_r2 = np.float32((width * 0.12)**2)
+    
+    # Squared distance from center, computed once and reused by every mask
+    dy2 = dy * dy
+    r2 = dx * dx + dy2
+    
+    # Tissue labels, later structures painting over earlier ones:
+    # body (1), air (0) outside; every pixel gets a label, so the tile
+    # needs no prior zero fill
+    labels = (r2 < body_r2).astype(np.uint8)
+    
+    # Bones (higher density)
+    # Spine (2), spanning the middle half of the image height
+    spine_mask = (np.abs(dx) < spine_half_width) & (np.abs(dy) < spine_half_height)
+    np.copyto(labels, 2, where=spine_mask)
+    
+    # Ribs (3), all 8 centers broadcast along a leading axis and reduced to one mask
+    rib_mask = (((dx - rib_dx)**2 + (dy - rib_dy)**2) < rib_r2).any(axis=0)
+    np.copyto(labels, 3, where=rib_mask)
+    
+    # Air (lungs, 4)
+    # Both lungs accumulate into one mask; |= avoids a third allocation
+    lung_mask = (dx + lung_offset) * (dx + lung_offset) + dy2 < lung_r2
+    lung_mask |= (dx - lung_offset) * (dx - lung_offset) + dy2 < lung_r2
+    np.copyto(labels, 4, where=lung_mask)
+    
+    _fill_tissues(tile, rng, labels, _CT_MEAN, _CT_STD)
+
+def _mr_tile(tile, rng, dx, dy, width, height):
+    """Fill one tile of an MR image; dx/dy are float32 offsets from the image center"""
+    
+    # MRI - different contrast and noise characteristics
+    shape = tile.shape
+    
+    # Geometry constants
+    m = min(width, height)
+    brain_r2 = np.float32((m * 0.35)**2)
+    white_matter_r2 = np.float32((m * 0.15)**2)
+    
+    # Squared distance from center, computed once and reused by every mask
+    r2 = dx * dx + dy * dy
+    
+    # Brain outline, labelled gray matter (1) to start with
+    brain_mask = r2 < brain_r2
+    labels = brain_mask.astype(np.uint8)
+    
+    # White matter (2), always inside the brain outline
+    np.copyto(labels, 2, where=r2 <= white_matter_r2)
+    
+    # CSF (3, darker); a 1-in-20 uint8 draw gives the 5% Bernoulli mask.
+    # It is applied last, as it is scattered through both gray and white matter
+    csf_regions = brain_mask & (rng.integers(0, 20, shape, dtype=np.uint8) == 0)
+    np.copyto(labels, 3, where=csf_regions)
+    
+    _fill_tissues(tile, rng, labels, _MR_MEAN, _MR_STD)
+
+def _us_tile(tile, rng, dx, dy, width, height, organ_offsets):
+    """Fill one tile of a US image; dx/dy are float32 offsets from the image center"""
+    
+    # Geometry constants
+    organ_r2 = np.float32((min(width, height) * 0.1)**2)
+    
+    # Ultrasound - speckle pattern
+    idx = rng.integers(0, 1 << 16, tile.shape, dtype=np.uint16)
+    np.take(_RAYLEIGH_LUT, idx, out=tile)
+    
+    # Simulated organ boundaries; organs cover a few percent of the image,
+    # so noise is only drawn for the pixels each organ actually touches
+    for organ_dx, organ_dy in organ_offsets:
+        organ_mask = ((dx - organ_dx)**2 + (dy - organ_dy)**2) < organ_r2
+        n = np.count_nonzero(organ_mask)
+        if n == 0:
+            continue
+        organ = _gaussian_noise(rng, 15000, 5000, n)
+        # Saturating add: never push a pixel past the uint16 maximum
+        speckle = tile[organ_mask]
+        tile[organ_mask] = speckle + np.minimum(organ, 65535 - speckle)
+
+def _generic_tile(tile, rng, dx, dy, width, height):
+    """Fill one tile of a generic medical image"""
+    
+    tile[...] = _gaussian_noise(rng, 25000, 10000, tile.shape)
+
+def _synthesize_tiled(image, fill_tile, seed_seq, max_workers=None, **params):
+    """Run fill_tile over TILE_SIZE blocks of image on a thread pool
+    
+    Each tile gets its own generator spawned from seed_seq, as a Generator
+    must not be shared between threads. numpy releases the GIL inside the
+    heavy ufuncs and samplers, so the tiles run concurrently.
+    """
+    
+    height, width = image.shape
+    center_y, center_x = height // 2, width // 2
+    origins = [(ty, tx) for ty in range(0, height, TILE_SIZE)
+               for tx in range(0, width, TILE_SIZE)]
+    rngs = [np.random.default_rng(s) for s in seed_seq.spawn(len(origins))]
+    
+    def run(origin, rng):
+        ty, tx = origin
+        tile = image[ty:ty + TILE_SIZE, tx:tx + TILE_SIZE]
+        tile_h, tile_w = tile.shape
+        dx = (np.arange(tile_w) + (tx - center_x)).astype(np.float32)[np.newaxis, :]
+        dy = (np.arange(tile_h) + (ty - center_y)).astype(np.float32)[:, np.newaxis]
+        fill_tile(tile, rng, dx, dy, width, height, **params)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        list(pool.map(run, origins, rngs))
+
+def generate_realistic_medical_image(width, height, modality='CT', seed=None):
+    """Generate realistic-looking medical image data
+    
+    All randomness derives from one PCG64 seed sequence, so passing the same
+    seed reproduces the same image; None draws fresh OS entropy. This only
+    holds within one backend: the CT/MR numba kernels and the numpy fallback
+    draw differently, so a seed gives different CT/MR images with and
+    without numba.
+    """
     
     print(f"Generating {width}x{height} {modality} image data...")
     
+    # Single seed sequence for the whole image; tile generators are spawned from it
+    seed_seq = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(seed_seq)
+    
+    # US stays on the numpy path even with numba: its Rayleigh LUT gather
+    # beats drawing per pixel from numba's generator
+    if HAS_NUMBA and modality in ('CT', 'MR'):
+        return _synthesize_jit(width, height, modality, rng)
+    
+    # Every tile function writes all of its pixels, so no zero fill is needed
+    image = np.empty((height, width), dtype=np.uint16)
+    
     if modality == 'CT':
-        # CT scan - simulate body cross-section with bones, organs, air
-        image = np.zeros((height, width), dtype=np.uint16)
-        
-        # Create circular body outline
-        center_y, center_x = height // 2, width // 2
-        y, x = np.ogrid[:height, :width]
-        
-        # Body (soft tissue)
-        body_mask = (x - center_x)**2 + (y - center_y)**2 < (min(width, height) * 0.4)**2
-        image[body_mask] = np.random.normal(1000, 200, np.sum(body_mask)).astype(np.uint16)
-        
-        # Bones (higher density)
-        bone_regions = []
-        # Spine
-        spine_mask = (np.abs(x - center_x) < width * 0.05) & (y > center_y * 0.5) & (y < center_y * 1.5)
-        image[spine_mask] = np.random.normal(3000, 300, np.sum(spine_mask)).astype(np.uint16)
-        
-        # Ribs
-        for angle in np.linspace(0, np.pi, 8):
-            rib_x = center_x + np.cos(angle) * width * 0.3
-            rib_y = center_y + np.sin(angle) * height * 0.2
-            rib_mask = ((x - rib_x)**2 + (y - rib_y)**2) < (width * 0.02)**2
-            image[rib_mask] = np.random.normal(2800, 200, np.sum(rib_mask)).astype(np.uint16)
-        
-        # Air (lungs)
-        lung_left = ((x - center_x + width * 0.15)**2 + (y - center_y)**2) < (width * 0.12)**2
-        lung_right = ((x - center_x - width * 0.15)**2 + (y - center_y)**2) < (width * 0.12)**2
-        image[lung_left | lung_right] = np.random.normal(-1000, 100, np.sum(lung_left | lung_right)).astype(np.uint16)
-        
-        # Ensure values are in valid range
-        image = np.clip(image, 0, 65535)
-        
+        _synthesize_tiled(image, _ct_tile, seed_seq, _max_threads)
     elif modality == 'MR':
-        # MRI - different contrast and noise characteristics
-        image = np.zeros((height, width), dtype=np.uint16)
-        
-        # Create brain-like structure
-        center_y, center_x = height // 2, width // 2
-        y, x = np.ogrid[:height, :width]
-        
-        # Brain outline
-        brain_mask = (x - center_x)**2 + (y - center_y)**2 < (min(width, height) * 0.35)**2
-        
-        # Gray matter
-        gray_matter = brain_mask & (((x - center_x)**2 + (y - center_y)**2) > (min(width, height) * 0.15)**2)
-        image[gray_matter] = np.random.normal(30000, 3000, np.sum(gray_matter)).astype(np.uint16)
-        
-        # White matter
-        white_matter = brain_mask & (((x - center_x)**2 + (y - center_y)**2) <= (min(width, height) * 0.15)**2)
-        image[white_matter] = np.random.normal(45000, 2000, np.sum(white_matter)).astype(np.uint16)
-        
-        # CSF (darker)
-        csf_regions = brain_mask & (np.random.random((height, width)) < 0.05)
-        image[csf_regions] = np.random.normal(10000, 1000, np.sum(csf_regions)).astype(np.uint16)
-        
-        # Ensure values are in valid range
-        image = np.clip(image, 0, 65535)
-        
+        _synthesize_tiled(image, _mr_tile, seed_seq, _max_threads)
     elif modality == 'US':
-        # Ultrasound - speckle pattern
-        image = np.random.rayleigh(20000, (height, width)).astype(np.uint16)
-        
-        # Add some structure
-        center_y, center_x = height // 2, width // 2
-        y, x = np.ogrid[:height, :width]
-        
-        # Simulated organ boundaries
-        for i in range(3):
-            organ_x = center_x + np.random.randint(-width//4, width//4)
-            organ_y = center_y + np.random.randint(-height//4, height//4)
-            organ_mask = ((x - organ_x)**2 + (y - organ_y)**2) < (min(width, height) * 0.1)**2
-            image[organ_mask] += np.random.normal(15000, 5000, np.sum(organ_mask)).astype(np.uint16)
-        
-        # Ensure values are in valid range
-        image = np.clip(image, 0, 65535)
-        
+        # Organ placement is drawn once so every tile sees the same organs
+        # Offsets are float32 so the masks stay float32 (an int64 scalar would
+        # promote the distance arithmetic to float64)
+        organ_offsets = [(np.float32(rng.integers(-width//4, width//4)),
+                          np.float32(rng.integers(-height//4, height//4)))
+                         for i in range(3)]
+        _synthesize_tiled(image, _us_tile, seed_seq, _max_threads, organ_offsets=organ_offsets)
     else:
         # Generic medical image
-        image = np.random.normal(25000, 10000, (height, width)).astype(np.uint16)
-        image = np.clip(image, 0, 65535)
+        _synthesize_tiled(image, _generic_tile, seed_seq, _max_threads)
     
     return image
 
-def create_dicom_file(output_path, target_size, modality='CT', patient_name="Test^Patient"):
+def create_dicom_file(output_path, target_size, modality='CT', patient_name="Test^Patient", seed=None):
     """Create a DICOM file with specified target size"""
     
     print(f"Creating {modality} DICOM file: {output_path}")
@@ -174,7 +416,7 @@ def create_dicom_file(output_path, target_size, modality='CT', patient_name="Tes
     print(f"Image dimensions: {width} x {height}")
     
     # Generate image data
-    pixel_array = generate_realistic_medical_image(width, height, modality)
+    pixel_array = generate_realistic_medical_image(width, height, modality, seed)
     
     # Create DICOM dataset
     ds = Dataset()
@@ -263,12 +505,22 @@ def create_dicom_file(output_path, target_size, modality='CT', patient_name="Tes
     ds.InstitutionName = "Test Institution"
     ds.StationName = "TEST_STATION"
     
-    # Add pixel data
-    ds.PixelData = pixel_array.tobytes()
-    
-    # Save the file
+    # Save the file. pydicom only renders the (small) header, without
+    # PixelData, into memory; the pixel payload is then written straight
+    # from the numpy buffer right after it instead of being copied
+    # into a bytes object and through pydicom's encoder. PixelData
+    # (7FE0,0010) has the highest tag in the dataset, so appending it
+    # keeps the elements in ascending order.
     print(f"Saving DICOM file...")
-    ds.save_as(output_path, write_like_original=False)
+    pixel_array = pixel_array.astype('<u2', copy=False)
+    header = io.BytesIO()
+    ds.save_as(header, write_like_original=False)
+    # Explicit VR Little Endian element header: tag, VR, reserved, length
+    header.write(struct.pack('<HH2sHI', 0x7FE0, 0x0010, b'OW', 0, pixel_array.nbytes))
+    
+    with open(output_path, 'wb') as fp:
+        fp.write(header.getbuffer())
+        pixel_array.tofile(fp)
     
     # Check final file size
     final_size = os.path.getsize(output_path)
@@ -277,18 +529,130 @@ def create_dicom_file(output_path, target_size, modality='CT', patient_name="Tes
     
     return final_size
 
+def load_manifest(manifest_path):
+    """Load batch specs as (output_path, target_size, modality, patient_name, seed) tuples
+    
+    Every entry is validated before any output directory is created, so a
+    bad manifest leaves nothing behind.
+    """
+    
+    with open(manifest_path) as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError("Manifest must be a JSON list of file entries")
+    
+    specs = []
+    for i, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Manifest entry {i}: expected an object, got {type(entry).__name__}")
+        missing = [key for key in ('size', 'output') if key not in entry]
+        if missing:
+            raise ValueError(f"Manifest entry {i}: missing required key(s) {', '.join(missing)}")
+        
+        output = entry['output']
+        try:
+            target_size = parse_size(str(entry['size']))
+        except ValueError:
+            raise ValueError(f"Manifest entry {i} ({output}): invalid size '{entry['size']}'")
+        modality = entry.get('modality', 'CT')
+        if modality not in MODALITIES:
+            raise ValueError(
+                f"Manifest entry {i} ({output}): unsupported modality '{modality}' "
+                f"(expected one of {', '.join(MODALITIES)})"
+            )
+        seed = entry.get('seed')
+        if seed is not None and (not isinstance(seed, int) or isinstance(seed, bool) or seed < 0):
+            raise ValueError(f"Manifest entry {i} ({output}): seed must be a non-negative integer")
+        
+        specs.append((
+            output,
+            target_size,
+            modality,
+            entry.get('patient_name', 'Test^Patient'),
+            seed
+        ))
+    
+    # Create output directories only once the whole manifest is valid
+    for output, *_ in specs:
+        os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    
+    return specs
+
+def _available_cpus():
+    """Number of CPUs this process may run on (respects taskset/cgroup pinning)"""
+    
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# Error raised by _init_batch_worker, re-raised by the first task of that worker
+_worker_init_error = None
+
+def _init_batch_worker(max_threads):
+    """Pool initializer: cap the threads each worker's synthesis may use
+    
+    An exception escaping a Pool initializer makes the worker die and be
+    respawned forever, so failures are stored and re-raised from the task
+    instead, which aborts the batch.
+    """
+    
+    global _max_threads, _worker_init_error
+    try:
+        _max_threads = max_threads
+        if HAS_NUMBA:
+            # numba's pool may be smaller than the CPU count (NUMBA_NUM_THREADS)
+            set_num_threads(min(max_threads, numba_config.NUMBA_NUM_THREADS))
+    except Exception as e:
+        _worker_init_error = e
+
+def _create_dicom_file_in_worker(*spec):
+    """Batch task: create_dicom_file, unless the worker failed to initialize"""
+    
+    if _worker_init_error is not None:
+        raise RuntimeError(f"Batch worker initialization failed: {_worker_init_error}")
+    return create_dicom_file(*spec)
+
 def main():
     parser = argparse.ArgumentParser(description='Generate large DICOM files for testing')
-    parser.add_argument('--size', required=True, help='Target file size (e.g., 100MB, 500MB, 1GB)')
-    parser.add_argument('--output', required=True, help='Output DICOM file path')
-    parser.add_argument('--modality', default='CT', choices=['CT', 'MR', 'US'], 
+    parser.add_argument('--size', help='Target file size (e.g., 100MB, 500MB, 1GB)')
+    parser.add_argument('--output', help='Output DICOM file path')
+    parser.add_argument('--modality', default='CT', choices=MODALITIES, 
                        help='DICOM modality (default: CT)')
     parser.add_argument('--patient-name', default='Test^Patient', 
                        help='Patient name (default: Test^Patient)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Random seed for reproducible pixel data (default: random); '
+                            'CT/MR output for a seed differs with and without numba installed')
+    parser.add_argument('--manifest',
+                       help='JSON manifest of files to generate in batch (replaces --size/--output)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Worker processes for --manifest (default: available CPUs)')
     
     args = parser.parse_args()
+    if not args.manifest and not (args.size and args.output):
+        parser.error('--size and --output are required unless --manifest is given')
     
     try:
+        if args.manifest:
+            specs = load_manifest(args.manifest)
+            print(f"Generating {len(specs)} files from {args.manifest}...")
+            
+            # Each file is independent, so generate them in separate processes.
+            # Entries without a "seed" draw fresh OS entropy, so the workers
+            # never produce correlated noise. Synthesis is itself threaded, so
+            # split the cores between workers rather than giving each all of them.
+            cpu_count = _available_cpus()
+            jobs = args.jobs or cpu_count
+            threads_per_job = max(1, cpu_count // jobs)
+            with multiprocessing.Pool(processes=jobs, initializer=_init_batch_worker,
+                                      initargs=(threads_per_job,)) as pool:
+                final_sizes = pool.starmap(_create_dicom_file_in_worker, specs)
+            
+            print()
+            for (output, _, modality, *_), final_size in zip(specs, final_sizes):
+                print(f"✅ {output}: {final_size:,} bytes ({final_size/(1024*1024):.1f} MB, {modality})")
+            return
+        
         target_size = parse_size(args.size)
         print(f"Target size: {target_size:,} bytes ({target_size/(1024*1024):.1f} MB)")
         
@@ -299,7 +663,8 @@ def main():
             args.output, 
             target_size, 
             args.modality, 
-            args.patient_name
+            args.patient_name,
+            args.seed
         )
         
         print(f"\n✅ Successfully created {args.output}")